@@ -1,17 +1,156 @@
 import json
 import logging
+import mmap
+import os
 import re
 import shutil
 import tempfile
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Union, Optional
+from types import ModuleType
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Union,
+    Optional,
+)
 from langchain_core.document_loaders.base import BaseLoader
 from langchain_core.documents import Document
-import opendataloader_pdf
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional speedup
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# Imported on first conversion (see `_get_opendataloader_pdf`) so that importing
+# the loader does not pay for the engine package; tests patch this attribute.
+opendataloader_pdf: Optional[ModuleType] = None
+
+# Internal separator used for page splitting (unique enough to avoid collisions)
+_PAGE_SPLIT_SEPARATOR = "\n<<<ODL_PAGE_BREAK_%page-number%>>>\n"
+
+# Matches a rendered separator and captures its page number, e.g.
+# "\n<<<ODL_PAGE_BREAK_2>>>\n" -> "2". Compiled once at import time.
+_PAGE_SPLIT_RE = re.compile(
+    re.escape(_PAGE_SPLIT_SEPARATOR).replace(re.escape("%page-number%"), r"(\d+)")
+)
+
+# Literal prefix of every rendered separator; a plain substring test for it
+# lets single-page output skip the regex scan entirely.
+_PAGE_SPLIT_PREFIX = _PAGE_SPLIT_SEPARATOR.partition("%page-number%")[0]
+
+# Output files at least this large are decoded straight from a read-only
+# memory map instead of being read into an intermediate bytes object first.
+_MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# JSON output at least this large is streamed element by element with `ijson`
+# (when installed) so that a split_pages load never holds the whole tree.
+_STREAM_JSON_THRESHOLD = 32 * 1024 * 1024
+
+# Text output at least this large is split into pages while it is being read,
+# in chunks of _STREAM_CHUNK_SIZE characters, instead of being read whole.
+_STREAM_TEXT_THRESHOLD = 16 * 1024 * 1024
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+
+def _read_text_file(path: Union[str, Path]) -> str:
+    """Read a UTF-8 output file, normalizing line endings like text mode does."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                text = str(mm, "utf-8")
+        else:
+            text = f.read().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _get_opendataloader_pdf() -> ModuleType:
+    """Return the `opendataloader_pdf` module, importing it on first use."""
+    global opendataloader_pdf
+    if opendataloader_pdf is None:
+        import opendataloader_pdf as module
+
+        opendataloader_pdf = module
+    return opendataloader_pdf
+
+
+def _is_non_decreasing(page_nums: List[Any]) -> bool:
+    """Return True if `page_nums` is in ascending order.
+
+    Page numbers that cannot be ordered (e.g. `null` next to an int) count
+    as out of order, so callers fall back to the dict grouping path.
+    """
+    try:
+        return all(a <= b for a, b in zip(page_nums, page_nums[1:]))
+    except TypeError:
+        return False
+
+
+def _json_loads(content: Union[str, bytes]) -> Any:
+    """Parse JSON with `orjson` when installed, falling back to the stdlib.
+
+    `orjson.JSONDecodeError` subclasses `json.JSONDecodeError`, so callers can
+    handle parse failures the same way regardless of the backend.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _iter_file_page_spans(path: Union[str, Path]) -> Iterator[Tuple[int, str]]:
+    """Yield `(page_num, page_text)` pairs while reading `path` in chunks.
+
+    Only the text after the last complete separator is buffered, so memory
+    stays proportional to the largest page instead of the whole file. Text
+    mode applies the same newline normalization as `_read_text_file`.
+    """
+    page_num = 1
+    buffer = ""
+    with open(path, "r", encoding="utf-8") as f:
+        while True:
+            chunk = f.read(_STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            # The buffer holds no complete separator. One cut off by the
+            # previous chunk must start at its last "\n", since separators
+            # contain no other newline before their final character.
+            last_newline = buffer.rfind("\n")
+            scan_from = last_newline if last_newline != -1 else len(buffer)
+            buffer += chunk
+
+            start = 0
+            for match in _PAGE_SPLIT_RE.finditer(buffer, scan_from):
+                yield page_num, buffer[start : match.start()]
+                page_num = int(match.group(1))
+                start = match.end()
+            if start:
+                buffer = buffer[start:]
+    yield page_num, buffer
+
+
+def _iter_json_kids(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Stream the top-level "kids" elements of a JSON output file."""
+    with open(path, "rb") as f:
+        # use_float keeps numbers JSON-serializable (ijson defaults to Decimal)
+        yield from ijson.items(f, "kids.item", use_float=True)
+
 
 class OpenDataLoaderPDFLoader(BaseLoader):
     """Load PDF files using `OpenDataLoaderPDF`.
@@ -71,6 +210,7 @@ class OpenDataLoaderPDFLoader(BaseLoader):
         hybrid_fallback: bool = False,
         # --- END SYNCED PARAMS ---
         split_pages: bool = True,
+        num_workers: int = 1,
     ):
         """Initialize the loader.
 
@@ -124,6 +264,10 @@ class OpenDataLoaderPDFLoader(BaseLoader):
                 Default: None (core engine defaults to 30000ms / 30 seconds).
             hybrid_fallback: Opt-in to Java fallback on backend failure.
                 Default: False.
+            num_workers: Number of concurrent conversions when loading several
+                paths. Default: 1 (all paths converted in a single call). Each
+                worker starts its own Java process, so Documents from different
+                workers may be yielded in any order.
         """
         if isinstance(file_path, (str, Path)):
             self.file_paths = [str(file_path)]
@@ -153,9 +297,19 @@ class OpenDataLoaderPDFLoader(BaseLoader):
         self.hybrid_fallback = hybrid_fallback
         # --- END SYNCED ASSIGNMENTS ---
         self.split_pages = split_pages
+        if self.format not in self._FORMAT_EXTENSIONS:
+            raise ValueError(
+                f"Invalid format '{self.format}'. "
+                f"Valid options are: {', '.join(self._FORMAT_EXTENSIONS)}"
+            )
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be at least 1, got {num_workers}")
+        self.num_workers = num_workers
 
-    # Internal separator used for page splitting (unique enough to avoid collisions)
-    _PAGE_SPLIT_SEPARATOR = "\n<<<ODL_PAGE_BREAK_%page-number%>>>\n"
+    _PAGE_SPLIT_SEPARATOR = _PAGE_SPLIT_SEPARATOR
+
+    # Output file extension written by the core engine for each format
+    _FORMAT_EXTENSIONS = {"json": "json", "text": "txt", "html": "html", "markdown": "md"}
 
     def _get_page_separator(self) -> Optional[str]:
         """Get the page separator for split_pages mode."""
@@ -163,49 +317,79 @@ class OpenDataLoaderPDFLoader(BaseLoader):
             return self._PAGE_SPLIT_SEPARATOR
         return None
 
+    def _make_metadata(self, base: Dict[str, Any], **extra: Any) -> Dict[str, Any]:
+        """Copy the per-file `base` metadata and add `extra` and the hybrid key.
+
+        `base` holds the keys shared by every Document of a file, so each
+        page only pays for a dict copy plus one or two item assignments.
+        """
+        metadata = base.copy()
+        metadata.update(extra)
+        if self.hybrid:
+            metadata["hybrid"] = self.hybrid
+        return metadata
+
+    @staticmethod
+    def _iter_page_spans(content: str) -> Iterator[Tuple[int, str]]:
+        """Yield `(page_num, page_text)` pairs delimited by the page separator.
+
+        Pages are sliced out of `content` one at a time via `finditer`, so no
+        intermediate list of all pages is built. Content before the first
+        separator (if any) is attributed to page 1.
+        """
+        if _PAGE_SPLIT_PREFIX not in content:
+            yield 1, content
+            return
+
+        page_num = 1
+        start = 0
+        for match in _PAGE_SPLIT_RE.finditer(content):
+            yield page_num, content[start : match.start()]
+            page_num = int(match.group(1))
+            start = match.end()
+        yield page_num, content[start:]
+
     def _split_into_pages(self, content: str, source_name: str) -> Iterator[Document]:
         """Split content by page separator and yield Documents for each page."""
-        # Build regex pattern to match separator with page number
         # The separator appears BEFORE each page's content with that page's number
         # e.g., "\n<<<ODL_PAGE_BREAK_1>>>\nPage 1 content\n<<<ODL_PAGE_BREAK_2>>>\nPage 2 content"
-        separator_pattern = re.escape(self._PAGE_SPLIT_SEPARATOR).replace(
-            re.escape("%page-number%"), r"(\d+)"
-        )
+        yield from self._page_documents(self._iter_page_spans(content), source_name)
 
-        # Split content using the separator pattern
-        parts = re.split(separator_pattern, content)
+    def _page_documents(
+        self, spans: Iterable[Tuple[int, str]], source_name: str
+    ) -> Iterator[Document]:
+        """Yield a Document per non-empty `(page_num, page_text)` span."""
+        base_metadata = {"source": source_name, "format": self.format}
+        for page_num, page_text in spans:
+            page_content = page_text.strip()
+            if page_content:  # Skip empty pages
+                yield Document(
+                    page_content=page_content,
+                    metadata=self._make_metadata(base_metadata, page=page_num),
+                )
 
-        # parts: [before_first_sep, page_num_1, content_1, page_num_2, content_2, ...]
-        # First part (index 0) is content before first separator (usually empty)
-        # Then alternating: page_num (odd indices), content (even indices > 0)
+    @staticmethod
+    def _group_elements_by_page(
+        elements: List[Dict[str, Any]],
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        """Yield `(page_num, elements)` groups in ascending page order.
 
-        # Handle content before first separator (if any, treat as page 1)
-        if parts[0].strip():
-            yield Document(
-                page_content=parts[0].strip(),
-                metadata={
-                    "source": source_name,
-                    "format": self.format,
-                    "page": 1,
-                    **({"hybrid": self.hybrid} if self.hybrid else {}),
-                },
-            )
+        The engine emits elements in reading order, so page numbers are
+        normally non-decreasing and consecutive runs can be grouped in a
+        single pass. Out-of-order input falls back to a dict + sort.
+        """
+        page_nums = [element.get("page number", 1) for element in elements]
+
+        if _is_non_decreasing(page_nums):
+            for page_num, run in groupby(zip(page_nums, elements), key=itemgetter(0)):
+                yield page_num, [element for _, element in run]
+            return
 
-        # Process remaining parts: (page_num, content) pairs
-        for i in range(1, len(parts), 2):
-            page_num = int(parts[i])
-            if i + 1 < len(parts):
-                page_content = parts[i + 1].strip()
-                if page_content:  # Skip empty pages
-                    yield Document(
-                        page_content=page_content,
-                        metadata={
-                            "source": source_name,
-                            "format": self.format,
-                            "page": page_num,
-                            **({"hybrid": self.hybrid} if self.hybrid else {}),
-                        },
-                    )
+        pages: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        for page_num, element in zip(page_nums, elements):
+            pages[page_num].append(element)
+        for page_num in sorted(pages):
+            yield page_num, pages[page_num]
 
     def _split_json_into_pages(
         self, data: Dict[str, Any], source_name: str
@@ -215,16 +399,43 @@ class OpenDataLoaderPDFLoader(BaseLoader):
         Each Document's page_content is a JSON string containing the structured
         elements for that page, preserving the original JSON structure.
         """
-        # Group elements by page number
-        pages: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        yield from self._json_page_documents(
+            self._group_elements_by_page(data.get("kids", [])), source_name
+        )
 
-        for element in data.get("kids", []):
-            page_num = element.get("page number", 1)
-            pages[page_num].append(element)
+    def _stream_json_into_pages(
+        self, path: Union[str, Path], source_name: str
+    ) -> Iterator[Document]:
+        """Like `_split_json_into_pages`, but streams elements from `path`.
+
+        A first streaming pass only collects page numbers. When they are in
+        reading order (the normal case), a second pass yields each page as
+        soon as its elements have been read, keeping one page in memory.
+        Out-of-order output needs the whole tree and is parsed in memory.
+        """
+        page_nums = [element.get("page number", 1) for element in _iter_json_kids(path)]
+        if not _is_non_decreasing(page_nums):
+            with open(path, "rb") as f:
+                data = _json_loads(f.read())
+            yield from self._split_json_into_pages(data, source_name)
+            return
+
+        runs = groupby(
+            _iter_json_kids(path), key=lambda element: element.get("page number", 1)
+        )
+        yield from self._json_page_documents(
+            ((page_num, list(run)) for page_num, run in runs), source_name
+        )
 
+    def _json_page_documents(
+        self,
+        pages: Iterable[Tuple[int, List[Dict[str, Any]]]],
+        source_name: str,
+    ) -> Iterator[Document]:
+        """Yield one JSON Document per `(page_num, elements)` group."""
+        base_metadata = {"source": source_name, "format": self.format}
         # Yield a Document for each page with JSON content
-        for page_num in sorted(pages.keys()):
-            page_elements = pages[page_num]
+        for page_num, page_elements in pages:
             page_data = {
                 "page number": page_num,
                 "kids": page_elements,
@@ -233,26 +444,131 @@ class OpenDataLoaderPDFLoader(BaseLoader):
 
             yield Document(
                 page_content=page_content,
-                metadata={
-                    "source": source_name,
-                    "format": self.format,
-                    "page": page_num,
-                    **({"hybrid": self.hybrid} if self.hybrid else {}),
-                },
+                metadata=self._make_metadata(base_metadata, page=page_num),
             )
 
+    def _run_convert(
+        self,
+        input_paths: List[str],
+        output_dir: str,
+        convert_kwargs: Dict[str, Any],
+    ) -> None:
+        """Run `opendataloader_pdf.convert` for `input_paths` into `output_dir`."""
+        # Get page separator for split_pages mode
+        page_sep = self._get_page_separator()
+        _get_opendataloader_pdf().convert(
+            input_path=input_paths,
+            output_dir=output_dir,
+            **convert_kwargs,
+            markdown_page_separator=page_sep,
+            text_page_separator=page_sep,
+            html_page_separator=page_sep,
+        )
+
+    def _convert_in_parallel(
+        self, output_dir: str, convert_kwargs: Dict[str, Any]
+    ) -> Generator[str, None, None]:
+        """Convert `file_paths` in up to `num_workers` concurrent shards.
+
+        Each shard gets its own `convert` call (and therefore its own Java
+        process) writing into a dedicated subdirectory of `output_dir`. Shard
+        directories are yielded as soon as their conversion finishes, so the
+        output of fast shards is processed while slower ones are still running.
+        """
+        num_shards = min(self.num_workers, len(self.file_paths))
+        with ThreadPoolExecutor(max_workers=num_shards) as executor:
+            futures = {}
+            for i in range(num_shards):
+                shard_dir = os.path.join(output_dir, f"shard-{i}")
+                os.mkdir(shard_dir)
+                future = executor.submit(
+                    self._run_convert,
+                    self.file_paths[i::num_shards],
+                    shard_dir,
+                    convert_kwargs,
+                )
+                futures[future] = shard_dir
+
+            try:
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        if self.hybrid:
+                            raise
+                        logger.error("Error during conversion: %s", e)
+                        continue
+                    yield futures[future]
+            finally:
+                # Don't start shards that are still queued if the caller
+                # stopped iterating or an error is propagating.
+                for future in futures:
+                    future.cancel()
+
+    def _load_output_dir(self, output_dir: str) -> Iterator[Document]:
+        """Read the converted files in `output_dir` and yield Documents."""
+        suffix = f".{self._FORMAT_EXTENSIONS[self.format]}"
+        try:
+            with os.scandir(output_dir) as entries:
+                files = [
+                    entry.path
+                    for entry in entries
+                    if entry.name.endswith(suffix) and entry.is_file()
+                ]
+        except FileNotFoundError:
+            # Match Path.glob, which yields nothing for a missing directory.
+            files = []
+
+        for file in files:
+            source_name = os.path.basename(file)[: -len(suffix)] + ".pdf"
+
+            if self.split_pages and self.format == "json":
+                if (
+                    ijson is not None
+                    and os.path.getsize(file) >= _STREAM_JSON_THRESHOLD
+                ):
+                    yield from self._stream_json_into_pages(file, source_name)
+                    continue
+                # Parse raw bytes and split by page number; the JSON
+                # parser decodes UTF-8 itself, so skip the text round-trip.
+                with open(file, "rb") as f:
+                    data = _json_loads(f.read())
+                yield from self._split_json_into_pages(data, source_name)
+                continue
+
+            if self.split_pages and os.path.getsize(file) >= _STREAM_TEXT_THRESHOLD:
+                yield from self._page_documents(
+                    _iter_file_page_spans(file), source_name
+                )
+                continue
+
+            content = _read_text_file(file)
+
+            if self.split_pages:
+                # Split by page separator pattern and yield each page
+                yield from self._split_into_pages(content, source_name)
+            else:
+                yield Document(
+                    page_content=content,
+                    metadata=self._make_metadata(
+                        {"source": source_name, "format": self.format}
+                    ),
+                )
+
     def lazy_load(self) -> Iterator[Document]:
-        """Sequentially process each PDF file and yield Documents."""
-
-        if self.format not in [
-            "json",
-            "text",
-            "html",
-            "markdown",
-        ]:
-            raise ValueError(
-                f"Invalid format '{self.format}'. Valid options are: 'json', 'text', 'html', 'markdown'"
-            )
+        """Convert the PDF files and yield Documents.
+
+        With the default `num_workers=1` all inputs are converted in a single
+        `convert` call. With more workers, inputs are split across concurrent
+        conversions and Documents are yielded as each one finishes.
+
+        Pages are yielded one at a time as each output file is read, so
+        iterating over `lazy_load()` instead of calling `load()` avoids
+        holding every Document of a large batch in memory at once.
+        """
+        # Resolve the engine before the conversion error handling below, so a
+        # missing or broken install raises ImportError instead of being logged.
+        _get_opendataloader_pdf()
 
         try:
             output_dir = tempfile.mkdtemp()
@@ -260,11 +576,9 @@ class OpenDataLoaderPDFLoader(BaseLoader):
             logger.error("Failed to create temp directory: %s", e)
             return
 
+        shards: Optional[Generator[str, None, None]] = None
         try:
             try:
-                # Get page separator for split_pages mode
-                page_sep = self._get_page_separator()
-
                 # --- BEGIN SYNCED CONVERT KWARGS ---
                 convert_kwargs = {
                     "format": [self.format],
@@ -295,59 +609,35 @@ class OpenDataLoaderPDFLoader(BaseLoader):
                 # are intentionally kept to pin the wrapper's chosen defaults.
                 convert_kwargs = {k: v for k, v in convert_kwargs.items() if v is not None}
 
-                opendataloader_pdf.convert(
-                    input_path=self.file_paths,
-                    output_dir=output_dir,
-                    **convert_kwargs,
-                    markdown_page_separator=page_sep,
-                    text_page_separator=page_sep,
-                    html_page_separator=page_sep,
-                )
+                converted_dirs: Iterable[str]
+                if self.num_workers > 1 and len(self.file_paths) > 1:
+                    # Shards run in the background, so a hybrid-mode shard
+                    # failure surfaces while iterating below and propagates
+                    # through the outer handler (still re-raised), not here.
+                    shards = self._convert_in_parallel(output_dir, convert_kwargs)
+                    converted_dirs = shards
+                else:
+                    self._run_convert(self.file_paths, output_dir, convert_kwargs)
+                    converted_dirs = [output_dir]
             except Exception as e:
                 if self.hybrid:
                     raise
                 logger.error("Error during conversion: %s", e)
                 return  # exits generator; finally still cleans up output_dir
 
-            ext_map = {"json": "json", "text": "txt", "html": "html", "markdown": "md"}
-            ext = ext_map.get(self.format)
-            if ext is None:
-                raise ValueError(
-                    f"Invalid format '{self.format}'. "
-                    f"Valid options are: {', '.join(ext_map)}"
-                )
-
-            output_path = Path(output_dir)
-            files = list(output_path.glob(f"*.{ext}"))
-            for file in files:
-                with open(file, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                source_name = file.with_suffix(".pdf").name
-
-                if self.split_pages:
-                    if self.format == "json":
-                        # Parse JSON and split by page number
-                        data = json.loads(content)
-                        yield from self._split_json_into_pages(data, source_name)
-                    else:
-                        # Split by page separator pattern and yield each page
-                        yield from self._split_into_pages(content, source_name)
-                else:
-                    yield Document(
-                        page_content=content,
-                        metadata={
-                            "source": source_name,
-                            "format": self.format,
-                            **({"hybrid": self.hybrid} if self.hybrid else {}),
-                        },
-                    )
+            for converted_dir in converted_dirs:
+                yield from self._load_output_dir(converted_dir)
         except Exception as e:
             # Output processing failure is fatal; re-raise so callers handle it.
             # Use debug level to avoid double-logging if caller also logs.
             logger.debug("Error processing output files", exc_info=True)
             raise
         finally:
+            # Close the shard generator first: that waits for in-flight
+            # conversions, which would otherwise write into output_dir after
+            # it has been removed.
+            if shards is not None:
+                shards.close()
             # Skip cleanup when external images are stored in the temp dir,
             # otherwise callers would get dangling file-path references.
             if not (self.image_output == "external" and self.image_dir is None):
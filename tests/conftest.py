@@ -1,17 +1,24 @@
 """Shared test utilities and fixtures."""
 
 import functools
+import shutil
 import subprocess
 
 
 @functools.lru_cache()
 def java_available() -> bool:
     """Check if Java is available on the system."""
+    # Skip the JVM start when nothing named "java" is on PATH. The probe is
+    # still needed otherwise: e.g. macOS ships a /usr/bin/java stub without
+    # a JDK.
+    if shutil.which("java") is None:
+        return False
     try:
         result = subprocess.run(
             ["java", "-version"],
-            capture_output=True,
-            text=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=10,
         )
         return result.returncode == 0
@@ -1,13 +1,56 @@
 """Unit tests for OpenDataLoaderPDFLoader."""
 
 import json
+import os
+import sys
+import time
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import pytest
 
 from langchain_opendataloader_pdf import OpenDataLoaderPDFLoader
 
 
+class _ConvertRecorder:
+    """Lightweight stand-in for `opendataloader_pdf` that records convert() calls.
+
+    Set `side_effect` to a callable to simulate the engine (write output files
+    or raise); it receives the same keyword arguments as `convert`.
+    """
+
+    def __init__(self):
+        self.calls = []
+        self.side_effect = None
+
+    def convert(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.side_effect is not None:
+            self.side_effect(**kwargs)
+
+
+@pytest.fixture
+def odl_recorder(monkeypatch, tmp_path):
+    """Replace the converter with a recorder and route output to `tmp_path`."""
+    recorder = _ConvertRecorder()
+    monkeypatch.setattr(
+        "langchain_opendataloader_pdf.document_loaders.opendataloader_pdf", recorder
+    )
+    monkeypatch.setattr(
+        "langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp",
+        lambda: str(tmp_path),
+    )
+    return recorder
+
+
+def _raising(exc):
+    """Return a convert side effect that raises `exc`."""
+
+    def convert(**kwargs):
+        raise exc
+
+    return convert
+
+
 class TestOpenDataLoaderPDFLoaderInit:
     """Test initialization and parameter handling."""
 
@@ -162,210 +205,130 @@ class TestOpenDataLoaderPDFLoaderInit:
 class TestOpenDataLoaderPDFLoaderConvertCall:
     """Test that convert() is called with correct arguments."""
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_basic_options(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_basic_options(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(
             file_path="test.pdf", format="text", quiet=True
         )
         list(loader.lazy_load())
 
-        mock_odl.convert.assert_called_once()
-        call_kwargs = mock_odl.convert.call_args[1]
+        assert len(odl_recorder.calls) == 1
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["input_path"] == ["test.pdf"]
         assert call_kwargs["format"] == ["text"]
         assert call_kwargs["quiet"] is True
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_password(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_password(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(file_path="test.pdf", password="secret")
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["password"] == "secret"
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_keep_line_breaks(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_keep_line_breaks(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(file_path="test.pdf", keep_line_breaks=True)
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["keep_line_breaks"] is True
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_use_struct_tree(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_use_struct_tree(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(file_path="test.pdf", use_struct_tree=True)
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["use_struct_tree"] is True
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_table_method(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_table_method(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(file_path="test.pdf", table_method="cluster")
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["table_method"] == "cluster"
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_reading_order(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_reading_order(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(file_path="test.pdf", reading_order="off")
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["reading_order"] == "off"
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_image_options(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_image_options(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(
             file_path="test.pdf", image_output="embedded", image_format="jpeg"
         )
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["image_output"] == "embedded"
         assert call_kwargs["image_format"] == "jpeg"
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_image_dir(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_image_dir(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(
             file_path="test.pdf", image_output="external", image_dir="./images"
         )
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["image_output"] == "external"
         assert call_kwargs["image_dir"] == "./images"
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_image_dir_none_by_default(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_image_dir_none_by_default(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(file_path="test.pdf")
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         # None values are omitted from kwargs (pass-through to core engine defaults)
         assert "image_dir" not in call_kwargs
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_replace_invalid_chars(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_replace_invalid_chars(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(
             file_path="test.pdf", replace_invalid_chars="?"
         )
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["replace_invalid_chars"] == "?"
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_sanitize(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_sanitize(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(file_path="test.pdf", sanitize=True)
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["sanitize"] is True
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_pages(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_pages(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(file_path="test.pdf", pages="1,3")
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["pages"] == "1,3"
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_include_header_footer(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_include_header_footer(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(
             file_path="test.pdf", include_header_footer=True
         )
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["include_header_footer"] is True
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_detect_strikethrough(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_detect_strikethrough(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(
             file_path="test.pdf", detect_strikethrough=True
         )
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["detect_strikethrough"] is True
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_detect_strikethrough_default_false(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_detect_strikethrough_default_false(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(file_path="test.pdf")
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["detect_strikethrough"] is False
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_hybrid_params(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_hybrid_params(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(
             file_path="test.pdf",
             hybrid="docling-fast",
@@ -376,23 +339,18 @@ class TestOpenDataLoaderPDFLoaderConvertCall:
         )
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["hybrid"] == "docling-fast"
         assert call_kwargs["hybrid_mode"] == "auto"
         assert call_kwargs["hybrid_url"] == "http://localhost:5002"
         assert call_kwargs["hybrid_timeout"] == "60000"
         assert call_kwargs["hybrid_fallback"] is True
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_hybrid_none_passthrough(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_hybrid_none_passthrough(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(file_path="test.pdf")
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         # None values are omitted from kwargs (pass-through to core engine defaults)
         assert "hybrid" not in call_kwargs
         assert "hybrid_mode" not in call_kwargs
@@ -401,12 +359,7 @@ class TestOpenDataLoaderPDFLoaderConvertCall:
         # False is not None, so it IS passed
         assert call_kwargs["hybrid_fallback"] is False
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_all_options_with_hybrid(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_all_options_with_hybrid(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(
             file_path=["a.pdf", "b.pdf"],
             format="markdown",
@@ -434,7 +387,7 @@ class TestOpenDataLoaderPDFLoaderConvertCall:
         )
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["input_path"] == ["a.pdf", "b.pdf"]
         assert call_kwargs["format"] == ["markdown"]
         assert call_kwargs["quiet"] is True
@@ -446,12 +399,7 @@ class TestOpenDataLoaderPDFLoaderConvertCall:
         assert call_kwargs["hybrid_timeout"] == "60000"
         assert call_kwargs["hybrid_fallback"] is True
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_passes_all_options_together(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_passes_all_options_together(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(
             file_path=["a.pdf", "b.pdf"],
             format="markdown",
@@ -474,7 +422,9 @@ class TestOpenDataLoaderPDFLoaderConvertCall:
         )
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        # Both inputs go through one convert call (a single JVM start)
+        assert len(odl_recorder.calls) == 1
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["input_path"] == ["a.pdf", "b.pdf"]
         assert call_kwargs["format"] == ["markdown"]
         assert call_kwargs["quiet"] is True
@@ -498,9 +448,8 @@ class TestOpenDataLoaderPDFLoaderValidation:
     """Test format validation."""
 
     def test_invalid_format_raises_error(self):
-        loader = OpenDataLoaderPDFLoader(file_path="test.pdf", format="invalid")
         with pytest.raises(ValueError, match="Invalid format"):
-            list(loader.lazy_load())
+            OpenDataLoaderPDFLoader(file_path="test.pdf", format="invalid")
 
     def test_valid_formats_accepted(self):
         for fmt in ["json", "text", "html", "markdown"]:
@@ -576,74 +525,40 @@ class TestOpenDataLoaderPDFLoaderSplitPages:
         assert docs[0].metadata["page"] == 1
         assert docs[1].metadata["page"] == 3
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_split_pages_sets_page_separator(self, mock_mkdtemp, mock_odl):
+    def test_split_pages_sets_page_separator(self, odl_recorder):
         """Test that split_pages=True sets the internal page separator."""
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
         loader = OpenDataLoaderPDFLoader(
             file_path="test.pdf", format="text", split_pages=True
         )
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["text_page_separator"] == loader._PAGE_SPLIT_SEPARATOR
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_split_pages_markdown_sets_separator(self, mock_mkdtemp, mock_odl):
+    def test_split_pages_markdown_sets_separator(self, odl_recorder):
         """Test that split_pages=True with markdown format sets markdown separator."""
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
         loader = OpenDataLoaderPDFLoader(
             file_path="test.pdf", format="markdown", split_pages=True
         )
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["markdown_page_separator"] == loader._PAGE_SPLIT_SEPARATOR
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    @patch("builtins.open", create=True)
-    @patch("langchain_opendataloader_pdf.document_loaders.Path")
-    def test_split_pages_yields_multiple_documents(
-        self, mock_path_class, mock_open, mock_mkdtemp, mock_odl
-    ):
+    def test_split_pages_yields_multiple_documents(self, odl_recorder, tmp_path):
         """Test that split_pages=True yields multiple documents from one file."""
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
 
-        # Mock file content with page separators (separator before each page)
-        mock_file_content = (
+        # Output file content with page separators (separator before each page)
+        (tmp_path / "document.txt").write_text(
             "\n<<<ODL_PAGE_BREAK_1>>>\n"
             "First page content"
             "\n<<<ODL_PAGE_BREAK_2>>>\n"
             "Second page content"
             "\n<<<ODL_PAGE_BREAK_3>>>\n"
-            "Third page content"
+            "Third page content",
+            encoding="utf-8",
         )
 
-        # Create mock file object
-        mock_file = MagicMock()
-        mock_file.name = "document.txt"
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_file.read.return_value = mock_file_content
-
-        mock_open.return_value = mock_file
-
-        # Create mock Path
-        mock_path_instance = MagicMock()
-        mock_file_path = MagicMock()
-        mock_file_path.with_suffix.return_value.name = "document.pdf"
-        mock_file_path.unlink = MagicMock()
-        mock_path_instance.glob.return_value = [mock_file_path]
-        mock_path_class.return_value = mock_path_instance
-
         loader = OpenDataLoaderPDFLoader(
             file_path="document.pdf", format="text", split_pages=True
         )
@@ -832,6 +747,22 @@ class TestOpenDataLoaderPDFLoaderHybridMetadata:
         docs = list(loader._split_into_pages(content, "test.pdf"))
         assert all(d.metadata["hybrid"] == "docling-fast" for d in docs)
 
+    def test_split_pages_metadata_not_shared(self):
+        """Each page Document must get its own metadata dict."""
+        loader = OpenDataLoaderPDFLoader(
+            file_path="test.pdf", hybrid="docling-fast", split_pages=True
+        )
+        content = (
+            "\n<<<ODL_PAGE_BREAK_1>>>\n"
+            "Page 1"
+            "\n<<<ODL_PAGE_BREAK_2>>>\n"
+            "Page 2"
+        )
+        docs = list(loader._split_into_pages(content, "test.pdf"))
+        docs[0].metadata["extra"] = True
+        assert "extra" not in docs[1].metadata
+        assert list(docs[1].metadata) == ["source", "format", "page", "hybrid"]
+
     def test_split_json_pages_metadata_includes_hybrid(self):
         loader = OpenDataLoaderPDFLoader(
             file_path="test.pdf", format="json", hybrid="docling-fast", split_pages=True
@@ -844,30 +775,12 @@ class TestOpenDataLoaderPDFLoaderHybridMetadata:
         docs = list(loader._split_json_into_pages(json_data, "test.pdf"))
         assert docs[0].metadata["hybrid"] == "docling-fast"
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    @patch("builtins.open", create=True)
-    @patch("langchain_opendataloader_pdf.document_loaders.Path")
-    def test_metadata_includes_hybrid_no_split(
-        self, mock_path_class, mock_open, mock_mkdtemp, mock_odl
-    ):
+    def test_metadata_includes_hybrid_no_split(self, odl_recorder, tmp_path):
         """Test hybrid metadata when split_pages=False (direct yield path)."""
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
-        mock_file_content = "Full document content"
-        mock_file = MagicMock()
-        mock_file.__enter__ = MagicMock(return_value=mock_file)
-        mock_file.__exit__ = MagicMock(return_value=False)
-        mock_file.read.return_value = mock_file_content
-        mock_open.return_value = mock_file
-
-        mock_path_instance = MagicMock()
-        mock_file_path = MagicMock()
-        mock_file_path.with_suffix.return_value.name = "document.pdf"
-        mock_file_path.unlink = MagicMock()
-        mock_path_instance.glob.return_value = [mock_file_path]
-        mock_path_class.return_value = mock_path_instance
+
+        (tmp_path / "document.txt").write_text(
+            "Full document content", encoding="utf-8"
+        )
 
         loader = OpenDataLoaderPDFLoader(
             file_path="document.pdf",
@@ -884,12 +797,9 @@ class TestOpenDataLoaderPDFLoaderHybridMetadata:
 class TestOpenDataLoaderPDFLoaderHybridErrors:
     """Test error behavior when hybrid mode is active."""
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_hybrid_error_reraise(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock(
-            side_effect=RuntimeError("Hybrid backend unreachable")
+    def test_hybrid_error_reraise(self, odl_recorder):
+        odl_recorder.side_effect = _raising(
+            RuntimeError("Hybrid backend unreachable")
         )
 
         loader = OpenDataLoaderPDFLoader(
@@ -898,25 +808,16 @@ class TestOpenDataLoaderPDFLoaderHybridErrors:
         with pytest.raises(RuntimeError, match="Hybrid backend unreachable"):
             list(loader.lazy_load())
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_non_hybrid_error_swallowed(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock(
-            side_effect=RuntimeError("Some error")
-        )
+    def test_non_hybrid_error_swallowed(self, odl_recorder):
+        odl_recorder.side_effect = _raising(RuntimeError("Some error"))
 
         loader = OpenDataLoaderPDFLoader(file_path="test.pdf")
         # Should NOT raise — existing silent behavior
         docs = list(loader.lazy_load())
         assert docs == []
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_output_processing_error_reraise(self, mock_mkdtemp, mock_odl, tmp_path):
+    def test_output_processing_error_reraise(self, odl_recorder, tmp_path):
         """Output-processing errors (after conversion) must propagate to callers."""
-        mock_mkdtemp.return_value = str(tmp_path)
-        mock_odl.convert = MagicMock()
 
         # Create a malformed output file that will cause json.loads to fail
         bad_file = tmp_path / "test.json"
@@ -935,36 +836,113 @@ class TestOpenDataLoaderPDFLoaderHybridErrors:
 class TestOpenDataLoaderPDFLoaderPathHandling:
     """Test file_path handling with Path objects and convert call."""
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_receives_string_from_path_object(self, mock_mkdtemp, mock_odl):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_receives_string_from_path_object(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(file_path=Path("test.pdf"))
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["input_path"] == ["test.pdf"]
         assert all(isinstance(p, str) for p in call_kwargs["input_path"])
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    @patch("langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp")
-    def test_convert_receives_strings_from_mixed_path_list(
-        self, mock_mkdtemp, mock_odl
-    ):
-        mock_mkdtemp.return_value = "/tmp/test"
-        mock_odl.convert = MagicMock()
-
+    def test_convert_receives_strings_from_mixed_path_list(self, odl_recorder):
         loader = OpenDataLoaderPDFLoader(
             file_path=[Path("a.pdf"), "b.pdf", Path("c.pdf")]
         )
         list(loader.lazy_load())
 
-        call_kwargs = mock_odl.convert.call_args[1]
+        call_kwargs = odl_recorder.calls[-1]
         assert call_kwargs["input_path"] == ["a.pdf", "b.pdf", "c.pdf"]
 
 
+def _fake_convert(input_path, output_dir, **kwargs):
+    """Write one text output file per input, like the real converter."""
+    for path in input_path:
+        out = Path(output_dir) / Path(path).with_suffix(".txt").name
+        out.write_text(f"content of {path}", encoding="utf-8")
+
+
+class TestOpenDataLoaderPDFLoaderParallel:
+    """Test num_workers sharding of multi-file conversion."""
+
+    def test_init_default_num_workers(self):
+        loader = OpenDataLoaderPDFLoader(file_path="test.pdf")
+        assert loader.num_workers == 1
+
+    def test_init_invalid_num_workers(self):
+        with pytest.raises(ValueError, match="num_workers"):
+            OpenDataLoaderPDFLoader(file_path="test.pdf", num_workers=0)
+
+    def test_single_worker_uses_one_convert_call(self, odl_recorder):
+        odl_recorder.side_effect = _fake_convert
+
+        loader = OpenDataLoaderPDFLoader(
+            file_path=["a.pdf", "b.pdf", "c.pdf"], split_pages=False
+        )
+        docs = list(loader.lazy_load())
+
+        assert len(odl_recorder.calls) == 1
+        assert len(docs) == 3
+
+    def test_multiple_workers_shard_inputs(self, odl_recorder, tmp_path):
+        odl_recorder.side_effect = _fake_convert
+
+        loader = OpenDataLoaderPDFLoader(
+            file_path=["a.pdf", "b.pdf", "c.pdf"], split_pages=False, num_workers=2
+        )
+        docs = list(loader.lazy_load())
+
+        assert len(odl_recorder.calls) == 2
+        shards = sorted(c["input_path"] for c in odl_recorder.calls)
+        assert shards == [["a.pdf", "c.pdf"], ["b.pdf"]]
+        assert sorted(d.metadata["source"] for d in docs) == ["a.pdf", "b.pdf", "c.pdf"]
+        assert not tmp_path.exists()
+
+    def test_early_close_waits_for_shards_before_cleanup(
+        self, odl_recorder, tmp_path
+    ):
+        def convert(input_path, output_dir, **kwargs):
+            if "b.pdf" in input_path:
+                time.sleep(0.2)
+            # Like the engine, create the output directory if it is missing
+            os.makedirs(output_dir, exist_ok=True)
+            _fake_convert(input_path, output_dir, **kwargs)
+
+        odl_recorder.side_effect = convert
+
+        loader = OpenDataLoaderPDFLoader(
+            file_path=["a.pdf", "b.pdf"], split_pages=False, num_workers=2
+        )
+        gen = loader.lazy_load()
+        assert next(gen).metadata["source"] == "a.pdf"
+        gen.close()
+
+        assert not tmp_path.exists()
+
+    def test_failed_shard_is_skipped(self, odl_recorder):
+        def convert(input_path, output_dir, **kwargs):
+            if "b.pdf" in input_path:
+                raise RuntimeError("conversion failed")
+            _fake_convert(input_path, output_dir, **kwargs)
+
+        odl_recorder.side_effect = convert
+
+        loader = OpenDataLoaderPDFLoader(
+            file_path=["a.pdf", "b.pdf"], split_pages=False, num_workers=2
+        )
+        docs = list(loader.lazy_load())
+
+        assert [d.metadata["source"] for d in docs] == ["a.pdf"]
+
+    def test_failed_shard_reraises_in_hybrid_mode(self, odl_recorder):
+        odl_recorder.side_effect = _raising(RuntimeError("backend down"))
+
+        loader = OpenDataLoaderPDFLoader(
+            file_path=["a.pdf", "b.pdf"], num_workers=2, hybrid="docling-fast"
+        )
+        with pytest.raises(RuntimeError, match="backend down"):
+            list(loader.lazy_load())
+
+
 class TestOpenDataLoaderPDFLoaderJsonEdgeCases:
     """Test _split_json_into_pages edge cases."""
 
@@ -996,6 +974,30 @@ class TestOpenDataLoaderPDFLoaderJsonEdgeCases:
         page_nums = [d.metadata["page"] for d in docs]
         assert page_nums == [1, 2, 3]
 
+    def test_split_json_interleaved_pages_grouped(self):
+        """Elements of one page split by another page should still be merged."""
+        loader = OpenDataLoaderPDFLoader(file_path="test.pdf", format="json")
+        data = {
+            "kids": [
+                {"page number": 1, "type": "text", "value": "a"},
+                {"page number": 2, "type": "text", "value": "b"},
+                {"page number": 1, "type": "text", "value": "c"},
+            ]
+        }
+        docs = list(loader._split_json_into_pages(data, "test.pdf"))
+        assert [d.metadata["page"] for d in docs] == [1, 2]
+        page1 = json.loads(docs[0].page_content)
+        assert [k["value"] for k in page1["kids"]] == ["a", "c"]
+
+    def test_split_json_null_page_numbers(self):
+        """Elements with a null page number are grouped under page None."""
+        loader = OpenDataLoaderPDFLoader(file_path="test.pdf", format="json")
+        data = {"kids": [{"page number": None}, {"page number": None}]}
+        docs = list(loader._split_json_into_pages(data, "test.pdf"))
+        assert len(docs) == 1
+        assert docs[0].metadata["page"] is None
+        assert len(json.loads(docs[0].page_content)["kids"]) == 2
+
     def test_split_json_multiple_elements_same_page(self):
         """Multiple elements on the same page should be grouped together."""
         loader = OpenDataLoaderPDFLoader(file_path="test.pdf", format="json")
@@ -1012,6 +1014,110 @@ class TestOpenDataLoaderPDFLoaderJsonEdgeCases:
         assert len(page1_data["kids"]) == 2
 
 
+class TestJsonLoads:
+    """Test the JSON parsing backend selection."""
+
+    def test_json_loads_parses_bytes(self):
+        from langchain_opendataloader_pdf.document_loaders import _json_loads
+
+        assert _json_loads(b'{"kids": []}') == {"kids": []}
+
+    def test_json_loads_falls_back_to_stdlib(self):
+        from langchain_opendataloader_pdf.document_loaders import _json_loads
+
+        with patch("langchain_opendataloader_pdf.document_loaders.orjson", None):
+            assert _json_loads('{"page number": 1}') == {"page number": 1}
+            with pytest.raises(json.JSONDecodeError):
+                _json_loads("not valid json")
+
+
+class TestLazyEngineImport:
+    """Test that the engine package is imported on first conversion only."""
+
+    def test_import_does_not_load_engine(self):
+        import subprocess
+
+        code = (
+            "import sys, langchain_opendataloader_pdf; "
+            "sys.exit('opendataloader_pdf' in sys.modules)"
+        )
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+    def test_engine_imported_on_first_use(self, monkeypatch):
+        import opendataloader_pdf as engine
+        from langchain_opendataloader_pdf import document_loaders
+
+        monkeypatch.setattr(document_loaders, "opendataloader_pdf", None)
+        assert document_loaders._get_opendataloader_pdf() is engine
+        assert document_loaders.opendataloader_pdf is engine
+
+    def test_missing_engine_raises_import_error(self, monkeypatch):
+        from langchain_opendataloader_pdf import document_loaders
+
+        monkeypatch.setattr(document_loaders, "opendataloader_pdf", None)
+        monkeypatch.setitem(sys.modules, "opendataloader_pdf", None)
+
+        loader = OpenDataLoaderPDFLoader(file_path="test.pdf")
+        with pytest.raises(ImportError):
+            loader.load()
+
+
+class TestOpenDataLoaderPDFLoaderJsonStreaming:
+    """Test the ijson streaming path for large JSON output."""
+
+    @pytest.fixture(autouse=True)
+    def require_ijson(self):
+        pytest.importorskip("ijson")
+
+    @pytest.mark.parametrize(
+        "kids",
+        [
+            [
+                {"page number": 1, "type": "heading", "bounding box": [1.5, 2.0]},
+                {"page number": 1, "type": "paragraph", "content": "caf\u00e9"},
+                {"page number": 2, "type": "paragraph", "content": "Page 2"},
+            ],
+            [
+                {"page number": 2, "type": "paragraph", "content": "b"},
+                {"type": "paragraph", "content": "no page number"},
+                {"page number": 2, "type": "paragraph", "content": "c"},
+            ],
+            [
+                {"page number": None, "type": "paragraph", "content": "x"},
+                {"page number": None, "type": "paragraph", "content": "y"},
+            ],
+        ],
+        ids=["in-order", "out-of-order", "null-page-numbers"],
+    )
+    def test_stream_matches_in_memory_split(self, tmp_path, kids):
+        path = tmp_path / "test.json"
+        path.write_text(json.dumps({"kids": kids}), encoding="utf-8")
+        loader = OpenDataLoaderPDFLoader(file_path="test.pdf", format="json")
+
+        streamed = list(loader._stream_json_into_pages(path, "test.pdf"))
+        expected = list(loader._split_json_into_pages({"kids": kids}, "test.pdf"))
+
+        assert [d.page_content for d in streamed] == [d.page_content for d in expected]
+        assert [d.metadata for d in streamed] == [d.metadata for d in expected]
+
+    @patch("langchain_opendataloader_pdf.document_loaders._STREAM_JSON_THRESHOLD", 0)
+    def test_lazy_load_streams_large_json(self, odl_recorder, tmp_path):
+        (tmp_path / "test.json").write_text(
+            json.dumps({"kids": [{"page number": 1, "content": "x"}]}),
+            encoding="utf-8",
+        )
+
+        loader = OpenDataLoaderPDFLoader(file_path="test.pdf", format="json")
+        with patch.object(
+            loader, "_stream_json_into_pages", wraps=loader._stream_json_into_pages
+        ) as spy:
+            docs = list(loader.lazy_load())
+
+        spy.assert_called_once()
+        assert len(docs) == 1
+        assert json.loads(docs[0].page_content)["kids"][0]["content"] == "x"
+
+
 class TestOpenDataLoaderPDFLoaderSplitPagesEdgeCases:
     """Test _split_into_pages edge cases."""
 
@@ -1055,6 +1161,70 @@ class TestOpenDataLoaderPDFLoaderSplitPagesEdgeCases:
         assert len(docs) == 1
         assert docs[0].metadata["page"] == 1
 
+    def test_split_pages_large_page_numbers(self):
+        """Multi-digit page numbers should be parsed from the separator."""
+        loader = OpenDataLoaderPDFLoader(file_path="test.pdf", format="text")
+        content = (
+            "\n<<<ODL_PAGE_BREAK_99>>>\n"
+            "Page 99"
+            "\n<<<ODL_PAGE_BREAK_100>>>\n"
+            "Page 100"
+        )
+        docs = list(loader._split_into_pages(content, "test.pdf"))
+        assert [d.metadata["page"] for d in docs] == [99, 100]
+        assert [d.page_content for d in docs] == ["Page 99", "Page 100"]
+
+
+class TestOpenDataLoaderPDFLoaderTextStreaming:
+    """Test chunked page splitting of large text output files."""
+
+    CONTENT = (
+        "Preamble\r\n"
+        "\n<<<ODL_PAGE_BREAK_1>>>\n"
+        "Page 1 line 1\r\nPage 1 line 2"
+        "\n<<<ODL_PAGE_BREAK_2>>>\n"
+        "   "
+        "\n<<<ODL_PAGE_BREAK_10>>>\n"
+        "Page 10 content"
+    )
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1024])
+    def test_streaming_matches_in_memory_split(self, tmp_path, chunk_size):
+        from langchain_opendataloader_pdf.document_loaders import (
+            _iter_file_page_spans,
+            _read_text_file,
+        )
+
+        path = tmp_path / "test.txt"
+        path.write_bytes(self.CONTENT.encode("utf-8"))
+        loader = OpenDataLoaderPDFLoader(file_path="test.pdf", format="text")
+
+        with patch(
+            "langchain_opendataloader_pdf.document_loaders._STREAM_CHUNK_SIZE",
+            chunk_size,
+        ):
+            streamed = list(
+                loader._page_documents(_iter_file_page_spans(path), "test.pdf")
+            )
+        expected = list(loader._split_into_pages(_read_text_file(path), "test.pdf"))
+
+        assert [(d.page_content, d.metadata) for d in streamed] == [
+            (d.page_content, d.metadata) for d in expected
+        ]
+        assert [d.metadata["page"] for d in streamed] == [1, 1, 10]
+
+    @patch("langchain_opendataloader_pdf.document_loaders._STREAM_TEXT_THRESHOLD", 0)
+    def test_lazy_load_streams_large_text(self, odl_recorder, tmp_path):
+        (tmp_path / "test.txt").write_text(
+            "\n<<<ODL_PAGE_BREAK_1>>>\nOne\n<<<ODL_PAGE_BREAK_2>>>\nTwo",
+            encoding="utf-8",
+        )
+
+        loader = OpenDataLoaderPDFLoader(file_path="test.pdf", format="text")
+        docs = list(loader.lazy_load())
+
+        assert [d.page_content for d in docs] == ["One", "Two"]
+
 
 class TestOpenDataLoaderPDFLoaderFormatValidation:
     """Test format handling edge cases."""
@@ -1069,41 +1239,82 @@ class TestOpenDataLoaderPDFLoaderFormatValidation:
         loader = OpenDataLoaderPDFLoader(file_path="test.pdf", format="Json")
         assert loader.format == "json"
 
-    def test_invalid_format_raises_on_load(self):
-        """Invalid format should raise ValueError when load is called."""
-        loader = OpenDataLoaderPDFLoader(file_path="test.pdf", format="xml")
+    def test_invalid_format_raises_on_init(self):
+        """Invalid format should raise ValueError when the loader is created."""
         with pytest.raises(ValueError, match="Invalid format"):
-            list(loader.lazy_load())
-
+            OpenDataLoaderPDFLoader(file_path="test.pdf", format="xml")
 
-class TestOpenDataLoaderPDFLoaderTempCleanup:
-    """Test temp file cleanup behavior."""
 
-    @patch("langchain_opendataloader_pdf.document_loaders.opendataloader_pdf")
-    def test_temp_files_deleted_after_read(self, mock_odl):
-        """Temp files should be deleted after reading."""
-        import tempfile
-        import os
+class TestReadTextFile:
+    """Test reading converter output files."""
 
-        real_tmpdir = tempfile.mkdtemp()
+    def test_read_text_file_normalizes_line_endings(self, tmp_path):
+        from langchain_opendataloader_pdf.document_loaders import _read_text_file
 
-        # Create a fake output file
-        fake_output = os.path.join(real_tmpdir, "test.txt")
-        with open(fake_output, "w") as f:
-            f.write("test content")
+        path = tmp_path / "out.txt"
+        path.write_bytes("caf\u00e9\r\nline two\rend".encode("utf-8"))
+        assert _read_text_file(path) == "caf\u00e9\nline two\nend"
 
-        mock_odl.convert = MagicMock()
+    def test_read_text_file_large_file_uses_mmap(self, tmp_path):
+        from langchain_opendataloader_pdf.document_loaders import _read_text_file
 
+        path = tmp_path / "out.txt"
+        path.write_text("\u00e9" * 8, encoding="utf-8")
         with patch(
-            "langchain_opendataloader_pdf.document_loaders.tempfile.mkdtemp",
-            return_value=real_tmpdir,
+            "langchain_opendataloader_pdf.document_loaders._MMAP_THRESHOLD", 1
         ):
-            loader = OpenDataLoaderPDFLoader(
-                file_path="test.pdf", format="text", split_pages=False
-            )
-            docs = list(loader.lazy_load())
+            assert _read_text_file(path) == "\u00e9" * 8
+
+
+class TestOpenDataLoaderPDFLoaderOutputDir:
+    """Test discovery of converter output files."""
+
+    def test_only_files_with_format_extension_are_loaded(self, tmp_path):
+        (tmp_path / "doc.txt").write_text("text output", encoding="utf-8")
+        (tmp_path / "doc.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "images.txt").mkdir()  # directory with a matching name
+
+        loader = OpenDataLoaderPDFLoader(
+            file_path="doc.pdf", format="text", split_pages=False
+        )
+        docs = list(loader._load_output_dir(str(tmp_path)))
+
+        assert len(docs) == 1
+        assert docs[0].page_content == "text output"
+        assert docs[0].metadata["source"] == "doc.pdf"
+
+    def test_format_changed_after_init_is_used(self, tmp_path):
+        (tmp_path / "doc.txt").write_text("text output", encoding="utf-8")
+        (tmp_path / "doc.json").write_text('{"kids": []}', encoding="utf-8")
+
+        loader = OpenDataLoaderPDFLoader(
+            file_path="doc.pdf", format="text", split_pages=False
+        )
+        loader.format = "json"
+        docs = list(loader._load_output_dir(str(tmp_path)))
+
+        assert [d.page_content for d in docs] == ['{"kids": []}']
+
+    def test_missing_output_dir_yields_nothing(self, tmp_path):
+        loader = OpenDataLoaderPDFLoader(file_path="doc.pdf")
+        assert list(loader._load_output_dir(str(tmp_path / "missing"))) == []
+
+
+class TestOpenDataLoaderPDFLoaderTempCleanup:
+    """Test temp file cleanup behavior."""
+
+    def test_temp_files_deleted_after_read(self, odl_recorder, tmp_path):
+        """Temp files should be deleted after reading."""
+        # Create a fake output file
+        fake_output = tmp_path / "test.txt"
+        fake_output.write_text("test content", encoding="utf-8")
+
+        loader = OpenDataLoaderPDFLoader(
+            file_path="test.pdf", format="text", split_pages=False
+        )
+        docs = list(loader.lazy_load())
 
         assert len(docs) == 1
         assert docs[0].page_content == "test content"
         # File should be deleted
-        assert not os.path.exists(fake_output)
+        assert not fake_output.exists()
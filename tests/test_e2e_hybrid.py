@@ -9,7 +9,6 @@ Set ODL_HYBRID_URL environment variable to override the default server URL.
 """
 
 import os
-import subprocess
 import urllib.error
 import urllib.request
 from pathlib import Path
@@ -17,14 +16,7 @@ from pathlib import Path
 import pytest
 
 from langchain_opendataloader_pdf import OpenDataLoaderPDFLoader
-
-
-def java_available() -> bool:
-    try:
-        result = subprocess.run(["java", "-version"], capture_output=True, text=True)
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+from tests.conftest import java_available
 
 
 HYBRID_URL = os.environ.get("ODL_HYBRID_URL", "http://localhost:5002")
@@ -4,9 +4,11 @@ These tests require Java 11+ and actual PDF files to run.
 They are skipped if the required resources are not available.
 """
 
+import json
 from pathlib import Path
 
 import pytest
+from langchain_core.documents import Document
 
 from langchain_opendataloader_pdf import OpenDataLoaderPDFLoader
 from tests.conftest import java_available
@@ -15,6 +17,11 @@ from tests.conftest import java_available
 SAMPLES_DIR = Path(__file__).parent.parent / "samples" / "pdf"
 SAMPLE_PDF = SAMPLES_DIR / "lorem.pdf"  # 1 page
 MULTI_PAGE_PDF = SAMPLES_DIR / "2408.02509v1.pdf"  # Multi-page PDF
+SAMPLE_PDFS = sorted(SAMPLES_DIR.glob("*.pdf"))
+
+needs_two_pdfs = pytest.mark.skipif(
+    len(SAMPLE_PDFS) < 2, reason="Need at least 2 sample PDFs"
+)
 
 
 # Skip all tests in this module if Java is not available or sample PDF is missing
@@ -30,13 +37,13 @@ pytestmark = [
 ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf() -> Path:
     """Return the path to the sample PDF file (1 page)."""
     return SAMPLE_PDF
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multi_page_pdf() -> Path:
     """Return the path to a multi-page PDF file. Skips test if not found."""
     if not MULTI_PAGE_PDF.exists():
@@ -44,23 +51,40 @@ def multi_page_pdf() -> Path:
     return MULTI_PAGE_PDF
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdfs() -> list[Path]:
     """Return paths to all sample PDF files."""
-    return list(SAMPLES_DIR.glob("*.pdf"))
+    return SAMPLE_PDFS
+
+
+@pytest.fixture(scope="session")
+def sample_text_docs(sample_pdf: Path) -> list[Document]:
+    """Load the sample PDF once as per-page text, shared by read-only tests."""
+    return OpenDataLoaderPDFLoader(
+        file_path=str(sample_pdf),
+        format="text",
+        quiet=True,
+        split_pages=True,
+    ).load()
+
+
+@pytest.fixture(scope="session")
+def multi_page_text_docs(multi_page_pdf: Path) -> list[Document]:
+    """Load the multi-page PDF once as per-page text, shared by read-only tests."""
+    return OpenDataLoaderPDFLoader(
+        file_path=str(multi_page_pdf),
+        format="text",
+        quiet=True,
+        split_pages=True,
+    ).load()
 
 
 class TestIntegrationBasic:
     """Basic integration tests."""
 
-    def test_load_pdf_as_text(self, sample_pdf: Path):
+    def test_load_pdf_as_text(self, sample_text_docs: list[Document]):
         """Test loading a PDF and getting text output."""
-        loader = OpenDataLoaderPDFLoader(
-            file_path=str(sample_pdf),
-            format="text",
-            quiet=True,
-        )
-        documents = loader.load()
+        documents = sample_text_docs
 
         assert len(documents) >= 1
         assert len(documents[0].page_content) > 0
@@ -79,8 +103,6 @@ class TestIntegrationBasic:
         assert len(documents) == 1
         assert documents[0].metadata["format"] == "json"
         # JSON output should be parseable
-        import json
-
         data = json.loads(documents[0].page_content)
         assert isinstance(data, (dict, list))
 
@@ -263,11 +285,9 @@ class TestIntegrationWithOptions:
         documents = loader.load()
         assert len(documents) == 1
 
+    @needs_two_pdfs
     def test_load_multiple_files(self, sample_pdfs: list[Path]):
         """Test loading multiple PDF files."""
-        if len(sample_pdfs) < 2:
-            pytest.skip("Need at least 2 sample PDFs")
-
         loader = OpenDataLoaderPDFLoader(
             file_path=[str(p) for p in sample_pdfs[:2]],
             format="text",
@@ -276,7 +296,10 @@ class TestIntegrationWithOptions:
         )
         documents = loader.load()
 
-        assert len(documents) == 2
+        # One Document per input from the single batched convert call
+        assert sorted(doc.metadata["source"] for doc in documents) == sorted(
+            p.name for p in sample_pdfs[:2]
+        )
 
 
 class TestIntegrationPathHandling:
@@ -293,11 +316,9 @@ class TestIntegrationPathHandling:
         assert len(documents) >= 1
         assert len(documents[0].page_content) > 0
 
+    @needs_two_pdfs
     def test_load_with_path_object_list(self, sample_pdfs: list[Path]):
         """Test loading with a list of Path objects."""
-        if len(sample_pdfs) < 2:
-            pytest.skip("Need at least 2 sample PDFs")
-
         loader = OpenDataLoaderPDFLoader(
             file_path=sample_pdfs[:2],  # list of Path objects
             format="text",
@@ -316,8 +337,10 @@ class TestIntegrationPathHandling:
             split_pages=False,
         )
         documents = loader.load()
-        # Should load all PDFs in the directory
-        assert len(documents) >= 1
+        # Should load every PDF in the directory, one Document each
+        assert sorted(doc.metadata["source"] for doc in documents) == sorted(
+            p.name for p in SAMPLE_PDFS
+        )
 
 
 class TestIntegrationLazyLoad:
@@ -339,15 +362,9 @@ class TestIntegrationLazyLoad:
 class TestIntegrationContent:
     """Test content extraction quality."""
 
-    def test_lorem_ipsum_content(self, sample_pdf: Path):
+    def test_lorem_ipsum_content(self, sample_text_docs: list[Document]):
         """Test that lorem ipsum PDF contains expected text."""
-        loader = OpenDataLoaderPDFLoader(
-            file_path=str(sample_pdf),
-            format="text",
-            quiet=True,
-            split_pages=False,
-        )
-        documents = loader.load()
+        documents = sample_text_docs
 
         assert len(documents) == 1
         content = documents[0].page_content.lower()
@@ -358,16 +375,9 @@ class TestIntegrationContent:
 class TestIntegrationSplitPages:
     """Test split_pages functionality with real PDFs."""
 
-    def test_split_pages_text_format(self, multi_page_pdf: Path):
+    def test_split_pages_text_format(self, multi_page_text_docs: list[Document]):
         """Test split_pages with text format on multi-page PDF."""
-
-        loader = OpenDataLoaderPDFLoader(
-            file_path=str(multi_page_pdf),
-            format="text",
-            quiet=True,
-            split_pages=True,
-        )
-        documents = loader.load()
+        documents = multi_page_text_docs
 
         # Multi-page PDF should produce multiple documents
         assert len(documents) > 1
@@ -427,16 +437,11 @@ class TestIntegrationSplitPages:
             assert "page" in doc.metadata
             assert doc.metadata["format"] == "html"
 
-    def test_split_pages_page_numbers_sequential(self, multi_page_pdf: Path):
+    def test_split_pages_page_numbers_sequential(
+        self, multi_page_text_docs: list[Document]
+    ):
         """Test that page numbers are sequential on multi-page PDF."""
-
-        loader = OpenDataLoaderPDFLoader(
-            file_path=str(multi_page_pdf),
-            format="text",
-            quiet=True,
-            split_pages=True,
-        )
-        documents = loader.load()
+        documents = multi_page_text_docs
 
         assert len(documents) > 1
         page_numbers = [doc.metadata["page"] for doc in documents]
@@ -458,15 +463,11 @@ class TestIntegrationSplitPages:
         assert len(documents) == 1
         assert "page" not in documents[0].metadata
 
-    def test_single_page_pdf_returns_one_document(self, sample_pdf: Path):
+    def test_single_page_pdf_returns_one_document(
+        self, sample_text_docs: list[Document]
+    ):
         """Test that a single-page PDF returns exactly one document."""
-        loader = OpenDataLoaderPDFLoader(
-            file_path=str(sample_pdf),
-            format="text",
-            quiet=True,
-            split_pages=True,
-        )
-        documents = loader.load()
+        documents = sample_text_docs
 
         assert len(documents) == 1
         assert documents[0].metadata["page"] == 1